@@ -1,156 +1,574 @@
 import os
+import sqlite3
+import struct
+import sys
+import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from mutagen import File
-from mutagen.mp4 import MP4
-from mutagen.mp3 import MP3
-from mutagen.flac import FLAC
-from mutagen.wave import WAVE
-
-def get_audio_bitrate(file_path):
-    """Get the bitrate of audio file in kbps"""
+
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.m4a', '.flac', '.wav', '.aac', '.ogg', '.wma', '.opus'})
+
+# Bitrates are remembered per (path, size, mtime) so unchanged files are not re-parsed
+_CACHE_PATH = Path.home() / '.gamdl_bitrate_cache.sqlite'
+# Bump whenever get_audio_bitrate starts returning different numbers
+_CACHE_VERSION = 1
+_cache = None
+# Kept as constants so sqlite3's statement cache reuses the prepared statements
+_CACHE_SELECT = "SELECT bitrate FROM br WHERE path=? AND size=? AND mtime=?"
+_CACHE_INSERT = "INSERT OR REPLACE INTO br VALUES (?,?,?,?)"
+
+def _get_cache():
+    """Open the bitrate cache on first use, None if it is unavailable"""
+    global _cache
+    if _cache is None:
+        try:
+            _cache = sqlite3.connect(_CACHE_PATH)
+            # One fsync per scan is plenty for data that can always be recomputed
+            _cache.execute("PRAGMA journal_mode=WAL")
+            _cache.execute("PRAGMA synchronous=NORMAL")
+            _cache.execute("PRAGMA temp_store=MEMORY")
+            _cache.execute("CREATE TABLE IF NOT EXISTS br(path TEXT PRIMARY KEY, size INT, mtime INT, bitrate INT)")
+            if _cache.execute("PRAGMA user_version").fetchone()[0] != _CACHE_VERSION:
+                # Entries written by an older bitrate calculation are stale
+                _cache.execute("DELETE FROM br")
+                _cache.execute(f"PRAGMA user_version = {_CACHE_VERSION}")
+                _cache.commit()
+        except sqlite3.Error as e:
+            print(f"Bitrate cache disabled: {e}")
+            _cache = False
+    return _cache or None
+
+def _walk_workers():
+    """Number of threads used to walk the directory tree"""
+    # APFS stops scaling at about 4 concurrent readers
+    if sys.platform == 'darwin':
+        return 4
+    return min(16, os.cpu_count() or 1)
+
+def _scan_dir(d, exts):
+    """Return (subdirectories, audio DirEntries) directly inside d"""
+    subdirs = []
+    files = []
     try:
-        file_ext = file_path.suffix.lower()
+        with os.scandir(d) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.is_file(follow_symlinks=False) and os.path.splitext(e.name)[1].lower() in exts:
+                    try:
+                        # Fill the DirEntry's stat cache while we're on a worker thread
+                        e.stat()
+                    except OSError:
+                        pass
+                    files.append(e)
+    except OSError:
+        # Unreadable directories are skipped, same as Path.rglob
+        pass
+    return subdirs, files
+
+def _walk_audio(root, exts=AUDIO_EXTENSIONS):
+    """List a DirEntry for every audio file below root, scanning directories in parallel"""
+    pending = deque([os.fspath(root)])
+    found = []
+    active = 0
+    cond = threading.Condition()
+    
+    def worker():
+        nonlocal active
+        while True:
+            with cond:
+                while not pending and active:
+                    cond.wait()
+                if not pending:
+                    # Nothing queued and nobody left to queue more: done
+                    return
+                d = pending.popleft()
+                active += 1
+            subdirs, files = [], []
+            try:
+                subdirs, files = _scan_dir(d, exts)
+            finally:
+                with cond:
+                    pending.extend(subdirs)
+                    found.extend(files)
+                    active -= 1
+                    cond.notify_all()
+    
+    workers = _walk_workers()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(worker) for _ in range(workers)]
+    # Re-raise anything a worker hit instead of returning a partial list
+    for future in futures:
+        future.result()
+    
+    # Threads finish in any order; keep the report stable between runs
+    found.sort(key=lambda e: e.path)
+    return found
+
+# The mutagen format modules are imported inside each reader, so only the
+# formats actually present in a scan are loaded (in every worker process)
+
+# Apple Music files keep moov (and its sound track) at the front, so the
+# bitrate can usually be read from this many bytes without touching the rest
+MP4_PREFIX_SIZE = 65536
+
+def _mp4_boxes(buf, start, end):
+    """Yield (type, payload start, box end) for the boxes in buf[start:end]"""
+    offset = start
+    while offset + 8 <= end:
+        size, kind = struct.unpack_from('>I4s', buf, offset)
+        header = 8
+        if size == 1:
+            if offset + 16 > end:
+                return
+            size = struct.unpack_from('>Q', buf, offset + 8)[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return
+        yield kind, offset + header, offset + size
+        offset += size
+
+def _mp4_child(buf, start, end, kind):
+    """(payload start, end) of the first kind box in buf[start:end], None if it isn't fully in buf"""
+    for child, child_start, child_end in _mp4_boxes(buf, start, end):
+        if child == kind:
+            return (child_start, child_end) if child_end <= end else None
+    return None
+
+def _descriptor_length(buf, offset):
+    """Decode an MPEG-4 descriptor length, returning (length, offset after it)"""
+    length = 0
+    for _ in range(4):
+        b = buf[offset]
+        offset += 1
+        length = (length << 7) | (b & 0x7F)
+        if not b & 0x80:
+            break
+    return length, offset
+
+def _esds_bitrate(buf, start, end):
+    """avgBitrate from an esds payload, None if the descriptors aren't as expected"""
+    # version/flags, then ES_Descriptor
+    offset = start + 4
+    if buf[offset] != 0x03:
+        return None
+    _, offset = _descriptor_length(buf, offset + 1)
+    flags = buf[offset + 2]
+    offset += 3
+    if flags & 0x80:
+        offset += 2  # dependsOn_ES_ID
+    if flags & 0x40:
+        offset += 1 + buf[offset]  # URL
+    if flags & 0x20:
+        offset += 2  # OCR_ES_Id
+    
+    # DecoderConfigDescriptor: objectType, streamType, bufferSizeDB, maxBitrate, avgBitrate
+    if buf[offset] != 0x04:
+        return None
+    _, offset = _descriptor_length(buf, offset + 1)
+    if offset + 13 > end:
+        return None
+    return struct.unpack_from('>I', buf, offset + 9)[0]
+
+def _mp4_prefix_bitrate(buf):
+    """Bitrate in bps of the first sound track in buf, None if mutagen has to work it out"""
+    # None is returned whenever the needed atoms are not all inside buf or
+    # the codec isn't plain AAC/ALAC
+    for kind, start, end in _mp4_boxes(buf, 0, len(buf)):
+        if kind == b'moov':
+            break
+    else:
+        return None
+    
+    # moov usually runs past the prefix (artwork), but its tracks come first
+    for kind, start, end in _mp4_boxes(buf, start, min(end, len(buf))):
+        if kind != b'trak':
+            continue
+        if end > len(buf):
+            return None
+        mdia = _mp4_child(buf, start, end, b'mdia')
+        hdlr = mdia and _mp4_child(buf, *mdia, b'hdlr')
+        if hdlr is None:
+            return None
+        if buf[hdlr[0] + 8:hdlr[0] + 12] != b'soun':
+            continue
         
-        if file_ext in ['.m4a', '.mp4']:
-            audio = MP4(file_path)
-            bitrate = audio.info.bitrate if hasattr(audio.info, 'bitrate') else 0
-            return bitrate // 1000  # Convert to kbps
-            
-        elif file_ext == '.mp3':
-            audio = MP3(file_path)
-            bitrate = audio.info.bitrate if hasattr(audio.info, 'bitrate') else 0
+        minf = _mp4_child(buf, *mdia, b'minf')
+        stbl = minf and _mp4_child(buf, *minf, b'stbl')
+        stsd = stbl and _mp4_child(buf, *stbl, b'stsd')
+        if stsd is None:
+            return None
+        # version/flags and entry count precede the first sample entry
+        entry = next(_mp4_boxes(buf, stsd[0] + 8, stsd[1]), None)
+        if entry is None:
+            return None
+        codec, entry_start, entry_end = entry
+        # SampleEntry + AudioSampleEntry fields come before the codec box
+        config = next(_mp4_boxes(buf, entry_start + 28, entry_end), None)
+        if config is None:
+            return None
+        if codec == b'mp4a' and config[0] == b'esds':
+            return _esds_bitrate(buf, config[1], config[2])
+        if codec == b'alac' and config[0] == b'alac':
+            # version/flags, then ALACSpecificConfig with avgBitRate at byte 16
+            return struct.unpack_from('>I', buf, config[1] + 20)[0]
+        return None
+    return None
+
+def _mp4_bitrate(file_path, file_size):
+    """Bitrate of an MP4/M4A file in kbps"""
+    with open(file_path, 'rb') as fh:
+        buf = fh.read(MP4_PREFIX_SIZE)
+        try:
+            bitrate = _mp4_prefix_bitrate(buf)
+        except (struct.error, IndexError):
+            bitrate = None
+        if bitrate is not None:
             return bitrate // 1000  # Convert to kbps
-            
-        elif file_ext == '.flac':
-            audio = FLAC(file_path)
-            # FLAC doesn't have bitrate in the same way, calculate it
-            if hasattr(audio.info, 'bitrate'):
-                return audio.info.bitrate // 1000
-            else:
-                # Calculate approximate bitrate from file size and duration
-                file_size = file_path.stat().st_size
-                duration = audio.info.length if hasattr(audio.info, 'length') else 0
-                if duration > 0:
-                    return int((file_size * 8) / (duration * 1000))
-                return 0
-                
-        elif file_ext in ['.wav', '.wave']:
-            audio = WAVE(file_path)
-            # WAV is uncompressed, calculate bitrate
-            file_size = file_path.stat().st_size
-            duration = audio.info.length if hasattr(audio.info, 'length') else 0
-            if duration > 0:
-                return int((file_size * 8) / (duration * 1000))
-            return 0
-            
-        elif file_ext in ['.aac', '.ogg', '.opus', '.wma']:
-            audio = File(file_path)
-            if audio and hasattr(audio.info, 'bitrate'):
-                return audio.info.bitrate // 1000
+        
+        from mutagen.mp4 import MP4Info, MP4NoTrackError
+        from mutagen.mp4._atom import Atoms
+        
+        # Only the stream info atoms are parsed; tags and artwork are never loaded
+        fh.seek(0)
+        try:
+            info = MP4Info(Atoms(fh), fh)
+        except MP4NoTrackError:
             return 0
-            
-    except Exception as e:
-        print(f"Error reading {file_path.name}: {e}")
-        return 0
+    return info.bitrate // 1000  # Convert to kbps
+
+def _mp3_bitrate(file_path, file_size):
+    """Bitrate of an MP3 file in kbps"""
+    from mutagen.mp3 import MPEGInfo
     
-    return 0
+    # MPEGInfo skips over the ID3 tag instead of parsing its frames
+    with open(file_path, 'rb') as fh:
+        info = MPEGInfo(fh)
+    return info.bitrate // 1000  # Convert to kbps
 
-def get_audio_quality(bitrate):
-    """Get quality description based on bitrate"""
-    if bitrate >= 320:
-        return "320kbps (High Quality)"
-    elif bitrate >= 256:
-        return "256kbps (Good Quality)"
-    elif bitrate >= 192:
-        return "192kbps (Medium Quality)"
-    elif bitrate >= 128:
-        return "128kbps (Standard Quality)"
-    elif bitrate > 0:
-        return f"{bitrate}kbps (Low Quality)"
+def _read_flac_header(fh):
+    """Return (length, audio bytes) by walking only the FLAC block headers"""
+    from mutagen.flac import StreamInfo
+    
+    if fh.read(4) != b'fLaC':
+        return None
+    length = None
+    while True:
+        header = fh.read(4)
+        if len(header) < 4:
+            return None
+        size = int.from_bytes(header[1:], 'big')
+        if header[0] & 0x7F == StreamInfo.code:
+            length = StreamInfo(fh.read(size)).length
+        else:
+            # Skip tags, seektable and pictures without reading them
+            fh.seek(size, 1)
+        if header[0] & 0x80:
+            break
+    if length is None:
+        return None
+    audio_start = fh.tell()
+    return length, fh.seek(0, 2) - audio_start
+
+def _flac_bitrate(file_path, file_size):
+    """Bitrate of a FLAC file in kbps"""
+    with open(file_path, 'rb') as fh:
+        header = _read_flac_header(fh)
+    if header:
+        # Same figure mutagen derives: audio stream bytes over duration
+        length, audio_size = header
+        if length > 0:
+            return int(audio_size * 8 / length) // 1000
+        return 0
+    
+    # ID3-prefixed or malformed header, let mutagen handle it
+    from mutagen.flac import FLAC
+    audio = FLAC(file_path)
+    # FLAC doesn't have bitrate in the same way, calculate it
+    if hasattr(audio.info, 'bitrate'):
+        return audio.info.bitrate // 1000
     else:
-        return "Unknown Quality"
+        # Calculate approximate bitrate from file size and duration
+        if file_size is None:
+            file_size = file_path.stat().st_size
+        duration = audio.info.length if hasattr(audio.info, 'length') else 0
+        if duration > 0:
+            return int((file_size * 8) / (duration * 1000))
+        return 0
 
-def check_audio_quality():
-    """Check bitrate of all audio files"""
-    script_dir = Path(__file__).parent.absolute()
+def _wav_bitrate(file_path, file_size):
+    """Bitrate of a WAV file in kbps"""
+    from mutagen.wave import WAVE
     
-    audio_extensions = ['.mp3', '.m4a', '.flac', '.wav', '.aac', '.ogg', '.wma', '.opus']
+    audio = WAVE(file_path)
+    # For PCM the format chunk gives the exact bitrate; compressed formats
+    # (e.g. MP3-in-WAV) report bits_per_sample as 0 and use the estimate below
+    try:
+        info = audio.info
+        bitrate = (info.sample_rate * info.bits_per_sample * info.channels) // 1000
+    except AttributeError:
+        bitrate = 0
+    if bitrate > 0:
+        return bitrate
     
-    print("Audio Quality Checker")
-    print("=" * 60)
+    # Approximate from file size and duration (includes header overhead)
+    if file_size is None:
+        file_size = file_path.stat().st_size
+    duration = audio.info.length if hasattr(audio.info, 'length') else 0
+    if duration > 0:
+        return int((file_size * 8) / (duration * 1000))
+    return 0
+
+def _generic_bitrate(file_path, file_size):
+    """Bitrate in kbps for any other format mutagen can detect"""
+    from mutagen import File
     
-    # Find all audio files
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(script_dir.rglob(f"*{ext}"))
+    audio = File(file_path)
+    if audio and hasattr(audio.info, 'bitrate'):
+        return audio.info.bitrate // 1000
+    return 0
+
+_BITRATE_READERS = {
+    '.m4a': _mp4_bitrate,
+    '.mp4': _mp4_bitrate,
+    '.mp3': _mp3_bitrate,
+    '.flac': _flac_bitrate,
+    '.wav': _wav_bitrate,
+    '.wave': _wav_bitrate,
+    '.aac': _generic_bitrate,
+    '.ogg': _generic_bitrate,
+    '.opus': _generic_bitrate,
+    '.wma': _generic_bitrate,
+}
+
+def get_audio_bitrate(file_path, file_size=None):
+    """Get the bitrate of audio file in kbps; a known file_size saves a stat() call"""
+    file_path = Path(file_path)
+    reader = _BITRATE_READERS.get(file_path.suffix.lower())
+    if reader is None:
+        return 0
     
-    if not audio_files:
-        print("No audio files found!")
-        return
+    try:
+        return reader(file_path, file_size)
+    except Exception as e:
+        print(f"Error reading {file_path.name}: {e}")
+        return 0
+
+def _probe(job):
+    """Return (path, bitrate, size) for one file; runs inside a worker process"""
+    path, file_size = job
+    return path, get_audio_bitrate(path, file_size), file_size
+
+def _is_rotational(path):
+    """Whether path lives on a spinning disk; None when it can't be determined"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    # Partitions have no queue/ of their own, it lives on the parent disk
+    sysfs = os.path.realpath(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}")
+    for d in (sysfs, os.path.dirname(sysfs)):
+        try:
+            with open(os.path.join(d, 'queue', 'rotational')) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+# ProcessPoolExecutor refuses more than 61 workers on Windows
+_WINDOWS_MAX_WORKERS = 61
+
+def _probe_workers(path):
+    """Number of probe processes to run for files on the same device as path"""
+    cpus = os.cpu_count() or 1
+    rotational = _is_rotational(path)
+    if rotational:
+        # Concurrent reads only add seeks on a spinning disk
+        workers = min(4, cpus)
+    elif rotational is False:
+        # SSDs need many reads in flight; a worker waiting on I/O leaves its core free
+        workers = min(32, cpus * 2)
+    else:
+        workers = cpus
+    if sys.platform == 'win32':
+        workers = min(_WINDOWS_MAX_WORKERS, workers)
+    return workers
+
+def _entry_stat(entry):
+    """(size, mtime_ns) from the DirEntry's stat result, zeros if it vanished"""
+    try:
+        st = entry.stat()
+    except OSError:
+        return 0, 0
+    return st.st_size, st.st_mtime_ns
+
+def probe_audio_files(audio_files):
+    """Read bitrate of every DirEntry in parallel, preserving order"""
+    cache = _get_cache()
+    results = []
+    misses = []
+    for e in audio_files:
+        # Sizes come from the DirEntry so the workers don't stat() again
+        size, mtime = _entry_stat(e)
+        row = None
+        if cache:
+            row = cache.execute(_CACHE_SELECT, (os.path.abspath(e.path), size, mtime)).fetchone()
+        if row:
+            results.append((e.path, row[0], size))
+        else:
+            misses.append((len(results), mtime))
+            results.append((e.path, 0, size))
     
-    print(f"Found {len(audio_files)} audio files\n")
+    if not misses:
+        return results
     
-    # Check quality for each file
-    quality_stats = {
-        "320kbps (High Quality)": 0,
-        "256kbps (Good Quality)": 0,
-        "192kbps (Medium Quality)": 0,
-        "128kbps (Standard Quality)": 0,
-        "Low Quality": 0,
-        "Unknown Quality": 0
-    }
+    jobs = [(results[i][0], results[i][2]) for i, _ in misses]
+    rows = []
+    # chunksize amortizes the pickling round-trip over several files
+    with ProcessPoolExecutor(max_workers=_probe_workers(jobs[0][0])) as ex:
+        for (i, mtime), result in zip(misses, ex.map(_probe, jobs, chunksize=32)):
+            results[i] = result
+            path, bitrate, size = result
+            # Failed reads are not remembered so they get retried next run
+            if bitrate:
+                rows.append((os.path.abspath(path), size, mtime, bitrate))
     
-    total_size = 0
+    if cache and rows:
+        # A single transaction for the whole scan
+        try:
+            with cache:
+                cache.executemany(_CACHE_INSERT, rows)
+        except sqlite3.Error as e:
+            print(f"Could not update bitrate cache: {e}")
+    return results
+
+# Lower bounds (kbps) of each quality bucket; bisect_right maps a bitrate
+# to its index in QUALITY_LABELS
+QUALITY_THRESHOLDS = (1, 128, 192, 256, 320)
+QUALITY_LABELS = (
+    "Unknown Quality",
+    "Low Quality",
+    "128kbps (Standard Quality)",
+    "192kbps (Medium Quality)",
+    "256kbps (Good Quality)",
+    "320kbps (High Quality)",
+)
+
+# A library only has a handful of distinct bitrates, so both lookups are memoized
+@lru_cache(maxsize=1024)
+def get_audio_quality_code(bitrate):
+    """Get the QUALITY_LABELS index for a bitrate in kbps"""
+    return bisect_right(QUALITY_THRESHOLDS, bitrate)
+
+@lru_cache(maxsize=1024)
+def get_audio_quality(bitrate):
+    """Get quality description based on bitrate"""
+    code = get_audio_quality_code(bitrate)
+    if code == 1:
+        # The cache hands every file with this bitrate the same string object
+        return f"{bitrate}kbps (Low Quality)"
+    return QUALITY_LABELS[code]
+
+# Number of per-file report entries buffered before writing to stdout
+REPORT_BATCH_SIZE = 256
+
+# Sizes stay in bytes until they are printed, then get scaled by this
+BYTES_TO_MB = 1.0 / 1048576.0
+
+def _print_details(audio_files, bitrates, sizes):
+    """Print one report entry per file"""
     print("📊 Audio File Quality Report:")
     print("-" * 60)
     
-    for audio_file in audio_files:
-        try:
-            file_size = audio_file.stat().st_size / (1024*1024)  # MB
-            total_size += file_size
-            
-            bitrate = get_audio_bitrate(audio_file)
-            quality = get_audio_quality(bitrate)
-            
-            # Update statistics
-            if "320kbps" in quality:
-                quality_stats["320kbps (High Quality)"] += 1
-            elif "256kbps" in quality:
-                quality_stats["256kbps (Good Quality)"] += 1
-            elif "192kbps" in quality:
-                quality_stats["192kbps (Medium Quality)"] += 1
-            elif "128kbps" in quality:
-                quality_stats["128kbps (Standard Quality)"] += 1
-            elif "Low Quality" in quality:
-                quality_stats["Low Quality"] += 1
-            else:
-                quality_stats["Unknown Quality"] += 1
-            
-            print(f"🔊 {audio_file.name}")
-            print(f"   📁 Location: {audio_file.parent.name}/")
-            print(f"   📊 Size: {file_size:.2f} MB")
-            print(f"   🎵 Bitrate: {bitrate} kbps")
-            print(f"   ⭐ Quality: {quality}")
-            print()
-            
-        except Exception as e:
-            print(f"❌ Error checking {audio_file.name}: {e}")
-            quality_stats["Unknown Quality"] += 1
-            print()
+    # Per-file entries are written in batches rather than one print() per line
+    lines = []
+    for audio_file, bitrate, size in zip(audio_files, bitrates, sizes):
+        file_size = size * BYTES_TO_MB
+        quality = get_audio_quality(bitrate)
+        
+        lines.append(f"🔊 {audio_file.name}\n"
+                     f"   📁 Location: {Path(audio_file.path).parent.name}/\n"
+                     f"   📊 Size: {file_size:.2f} MB\n"
+                     f"   🎵 Bitrate: {bitrate} kbps\n"
+                     f"   ⭐ Quality: {quality}\n\n")
+        if len(lines) >= REPORT_BATCH_SIZE:
+            sys.stdout.writelines(lines)
+            lines.clear()
+    sys.stdout.writelines(lines)
+    sys.stdout.flush()
+
+def _print_groups(audio_files, bitrates, sizes):
+    """Print the files grouped by quality"""
+    bitrate_groups = {}
+    for audio_file, bitrate, size in zip(audio_files, bitrates, sizes):
+        quality = get_audio_quality(bitrate)
+        if quality not in bitrate_groups:
+            bitrate_groups[quality] = []
+        bitrate_groups[quality].append((audio_file, size))
+    
+    for quality, files in bitrate_groups.items():
+        print(f"\n{quality} ({len(files)} files):")
+        for audio_file, size in files:
+            file_size = size * BYTES_TO_MB
+            print(f"   🔊 {audio_file.name} ({file_size:.1f} MB)")
+    print()
+
+def _print_summary(quality_codes, sizes):
+    """Print the quality distribution and totals"""
+    quality_stats = [0] * len(QUALITY_LABELS)
+    for code in quality_codes:
+        quality_stats[code] += 1
+    # Summed as exact ints and converted once
+    total_size = sum(sizes) * BYTES_TO_MB
     
-    # Print summary
     print("=" * 60)
     print("📈 QUALITY SUMMARY:")
     print("=" * 60)
     
-    for quality_type, count in quality_stats.items():
+    for code, count in reversed(list(enumerate(quality_stats))):
         if count > 0:
-            percentage = (count / len(audio_files)) * 100
-            print(f"{quality_type}: {count} files ({percentage:.1f}%)")
+            percentage = (count / len(quality_codes)) * 100
+            print(f"{QUALITY_LABELS[code]}: {count} files ({percentage:.1f}%)")
     
-    print(f"\n📦 Total files: {len(audio_files)}")
+    print(f"\n📦 Total files: {len(quality_codes)}")
     print(f"💾 Total size: {total_size:.2f} MB")
 
+def _scan(root, detailed=False, group=False):
+    """Probe and summarize all audio files below root, returning (files, bitrates, sizes, quality_codes)"""
+    audio_files = _walk_audio(root)
+    
+    if not audio_files:
+        print("No audio files found!")
+        return None
+    
+    print(f"Found {len(audio_files)} audio files\n")
+    
+    results = probe_audio_files(audio_files)
+    bitrates = [bitrate for _, bitrate, _ in results]
+    sizes = [size for _, _, size in results]
+    quality_codes = [get_audio_quality_code(bitrate) for bitrate in bitrates]
+    
+    if detailed:
+        _print_details(audio_files, bitrates, sizes)
+    if group:
+        _print_groups(audio_files, bitrates, sizes)
+    _print_summary(quality_codes, sizes)
+    
+    return audio_files, bitrates, sizes, quality_codes
+
+def check_audio_quality():
+    """Check bitrate of all audio files"""
+    print("Audio Quality Checker")
+    print("=" * 60)
+    _scan(Path(__file__).parent.absolute(), detailed=True)
+
 def check_specific_folder():
     """Check audio quality in a specific folder"""
     folder_path = input("Enter folder path to check: ").strip()
@@ -165,83 +583,15 @@ def check_specific_folder():
         print(f"Folder '{folder_path}' does not exist!")
         return
     
-    audio_extensions = ['.mp3', '.m4a', '.flac', '.wav', '.aac', '.ogg', '.wma', '.opus']
-    
     print(f"\nChecking audio quality in: {target_folder}")
     print("=" * 60)
-    
-    # Find all audio files in the specified folder
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(target_folder.rglob(f"*{ext}"))
-    
-    if not audio_files:
-        print("No audio files found in the specified folder!")
-        return
-    
-    print(f"Found {len(audio_files)} audio files\n")
-    
-    # Group by bitrate
-    bitrate_groups = {}
-    
-    for audio_file in audio_files:
-        try:
-            bitrate = get_audio_bitrate(audio_file)
-            quality = get_audio_quality(bitrate)
-            
-            if quality not in bitrate_groups:
-                bitrate_groups[quality] = []
-            bitrate_groups[quality].append(audio_file)
-            
-        except Exception as e:
-            print(f"Error checking {audio_file.name}: {e}")
-    
-    # Print grouped results
-    for quality, files in bitrate_groups.items():
-        print(f"\n{quality} ({len(files)} files):")
-        for audio_file in files:
-            file_size = audio_file.stat().st_size / (1024*1024)  # MB
-            print(f"   🔊 {audio_file.name} ({file_size:.1f} MB)")
+    _scan(target_folder, group=True)
 
 def quick_quality_check():
     """Quick check - show only summary without detailed file list"""
-    script_dir = Path(__file__).parent.absolute()
-    
-    audio_extensions = ['.mp3', '.m4a', '.flac', '.wav', '.aac', '.ogg', '.wma', '.opus']
-    
-    audio_files = []
-    for ext in audio_extensions:
-        audio_files.extend(script_dir.rglob(f"*{ext}"))
-    
-    if not audio_files:
-        print("No audio files found!")
-        return
-    
-    quality_stats = {}
-    total_size = 0
-    
-    for audio_file in audio_files:
-        try:
-            file_size = audio_file.stat().st_size / (1024*1024)
-            total_size += file_size
-            
-            bitrate = get_audio_bitrate(audio_file)
-            quality = get_audio_quality(bitrate)
-            
-            quality_stats[quality] = quality_stats.get(quality, 0) + 1
-            
-        except Exception:
-            quality_stats["Unknown Quality"] = quality_stats.get("Unknown Quality", 0) + 1
-    
     print("\n🎵 QUICK QUALITY CHECK:")
-    print("=" * 40)
-    print(f"Total files: {len(audio_files)}")
-    print(f"Total size: {total_size:.1f} MB")
-    print("\nQuality Distribution:")
-    
-    for quality, count in sorted(quality_stats.items(), key=lambda x: x[1], reverse=True):
-        percentage = (count / len(audio_files)) * 100
-        print(f"  {quality}: {count} files ({percentage:.1f}%)")
+    print("=" * 60)
+    _scan(Path(__file__).parent.absolute())
 
 def main():
     print("Audio Quality Checker")
@@ -1,10 +1,99 @@
+import struct
 import sys
 from pathlib import Path
-from mutagen.mp4 import MP4, MP4Cover
-from PIL import Image
-from io import BytesIO
+from mutagen.mp4 import MP4Cover, MP4Info
+from mutagen.mp4._atom import Atoms
 
-def get_audio_info(file_path):
+# iTunes text tags printed by get_audio_info
+_TEXT_TAGS = (b'\xa9nam', b'\xa9ART', b'\xa9alb', b'aART')
+
+# Usually enough of a cover to get past EXIF/ICC segments to the JPEG frame
+# header; the rest of the image is only read when the frame header is further in
+_COVER_HEADER_SIZE = 64 * 1024
+
+# JPEG start-of-frame markers (C4, C8 and CC share the range but are not SOF)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def _img_dims(buf, fmt):
+    """Read (width, height) from the PNG/JPEG header without decoding the image"""
+    if fmt == 'PNG':
+        if len(buf) < 24:
+            raise ValueError("embedded PNG album art is truncated")
+        width, height = struct.unpack('>II', buf[16:24])
+        return width, height
+
+    # Walk the JPEG segments after SOI until the frame header
+    offset = 2
+    while offset + 4 <= len(buf):
+        if buf[offset] != 0xFF:
+            break
+        marker = buf[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > len(buf):
+                break
+            height, width = struct.unpack('>HH', buf[offset + 5:offset + 9])
+            return width, height
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            # Standalone markers carry no length field
+            offset += 2
+            continue
+        offset += 2 + struct.unpack('>H', buf[offset + 2:offset + 4])[0]
+    raise ValueError("could not find image dimensions in embedded album art")
+
+def _cover_resolution(fh, size, image_format):
+    """(width, height) of the cover payload at the current position, None if unreadable"""
+    buf = fh.read(min(size, _COVER_HEADER_SIZE))
+    try:
+        return _img_dims(buf, image_format)
+    except ValueError:
+        pass
+    if len(buf) < size:
+        # Large APP segments (EXIF/XMP/ICC) push the frame header past the prefix
+        buf += fh.read(size - len(buf))
+        try:
+            return _img_dims(buf, image_format)
+        except ValueError:
+            pass
+    return None
+
+def _read_ilst(fh, atoms, with_art):
+    """Return ({tag: text}, cover) from the ilst atom without loading the artwork
+
+    cover is (format, size in bytes, resolution or None) for the first
+    covr item, or None if there is no art. The image itself is only read
+    when with_art is set.
+    """
+    tags = {}
+    cover = None
+    try:
+        ilst = atoms[b'moov', b'udta', b'meta', b'ilst']
+    except KeyError:
+        return tags, cover
+
+    for item in ilst.children:
+        if item.name in _TEXT_TAGS and item.name not in tags:
+            ok, data = item.read(fh)
+            # data atom: size, 'data', type, locale, then the UTF-8 value
+            if ok and data[4:8] == b'data':
+                size = struct.unpack('>I', data[:4])[0]
+                tags[item.name] = data[16:size].decode('utf-8', 'replace')
+        elif item.name == b'covr' and cover is None:
+            # Only the first data atom's header, not the image payload
+            fh.seek(item.offset + 8)
+            header = fh.read(16)
+            if len(header) < 16 or header[4:8] != b'data':
+                continue
+            size, _, flags = struct.unpack('>I4sI', header[:12])
+            image_format = 'JPEG' if flags & 0xFFFFFF == MP4Cover.FORMAT_JPEG else 'PNG'
+            resolution = _cover_resolution(fh, size - 16, image_format) if with_art else None
+            cover = (image_format, size - 16, resolution)
+    return tags, cover
+
+def get_audio_info(file_path, with_art=False):
     file_path = Path(file_path)
     if not file_path.exists():
         print(f"File not found: {file_path}")
@@ -15,12 +104,17 @@ def get_audio_info(file_path):
         return
 
     try:
-        audio = MP4(file_path)
+        # The atom tree is indexed without reading payloads, so only the
+        # stream info, the printed tags and (with_art) the cover header are read
+        with open(file_path, 'rb') as fh:
+            atoms = Atoms(fh)
+            info = MP4Info(atoms, fh)
+            tags, cover = _read_ilst(fh, atoms, with_art)
 
         # Basic audio info
-        bitrate = audio.info.bitrate if hasattr(audio.info, 'bitrate') else 0
-        sample_rate = audio.info.sample_rate if hasattr(audio.info, 'sample_rate') else 0
-        length = audio.info.length if hasattr(audio.info, 'length') else 0
+        bitrate = info.bitrate if hasattr(info, 'bitrate') else 0
+        sample_rate = info.sample_rate if hasattr(info, 'sample_rate') else 0
+        length = info.length if hasattr(info, 'length') else 0
         file_size = file_path.stat().st_size / (1024*1024)
 
         # Determine audio quality
@@ -38,19 +132,14 @@ def get_audio_info(file_path):
             quality = "AAC 256kbps or lower"
 
         # Metadata tags
-        title = audio.get('\xa9nam', ['Unknown'])[0]
-        artist = audio.get('\xa9ART', ['Unknown'])[0]
-        album = audio.get('\xa9alb', ['Unknown'])[0]
-        album_artist = audio.get('aART', ['Unknown'])[0]
+        title = tags.get(b'\xa9nam', 'Unknown')
+        artist = tags.get(b'\xa9ART', 'Unknown')
+        album = tags.get(b'\xa9alb', 'Unknown')
+        album_artist = tags.get(b'aART', 'Unknown')
 
         # Embedded album art
-        covers = audio.get('covr', [])
-        if covers:
-            cover = covers[0]
-            image_format = 'JPEG' if cover.imageformat == MP4Cover.FORMAT_JPEG else 'PNG'
-            image = Image.open(BytesIO(cover))
-            resolution = image.size
-            cover_size = len(cover)
+        if cover:
+            image_format, cover_size, resolution = cover
         else:
             image_format = None
             resolution = None
@@ -67,8 +156,12 @@ def get_audio_info(file_path):
         print(f"Duration: {int(length//60)}:{int(length%60):02d}")
         print(f"File Size: {file_size:.2f} MB")
         print(f"Quality: {quality}")
-        if covers:
+        if resolution:
             print(f"Embedded Album Art: {image_format}, {resolution[0]}x{resolution[1]} px, {cover_size/1024:.2f} KB")
+        elif cover and with_art:
+            print(f"Embedded Album Art: {image_format}, unknown resolution, {cover_size/1024:.2f} KB")
+        elif cover:
+            print(f"Embedded Album Art: {image_format}, {cover_size/1024:.2f} KB (use --with-art for resolution)")
         else:
             print("No embedded album art found")
 
@@ -76,8 +169,9 @@ def get_audio_info(file_path):
         print(f"Error reading file: {e}")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python check_audio_metadata.py <file.m4a or file.mp4>")
+    args = [arg for arg in sys.argv[1:] if arg != '--with-art']
+    if not args:
+        print("Usage: python check_audio_metadata.py [--with-art] <file.m4a or file.mp4>")
         sys.exit(1)
 
-    get_audio_info(sys.argv[1])
+    get_audio_info(args[0], with_art='--with-art' in sys.argv[1:])